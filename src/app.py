@@ -1,19 +1,30 @@
+import logging
 import os
-import tomllib
+from concurrent.futures import ThreadPoolExecutor
 
 import yaml
-from flask import jsonify, request, Flask
+from flask import jsonify, request, send_file, Flask
 from flask_swagger_ui import get_swaggerui_blueprint
 
 from models.error_model import ErrorModel
 from models.setup_model import SetupModel
 from plugins.plugin_base import PluginBase
-from utilities.common import new_trace_id, mount_session
+from utilities.common import configure_logging, dump_json, new_trace_id, mount_session
+from utilities.config import load_config
+from utilities.lowercase_converter import LowercaseConverter
 from utilities.plugin_factory import PluginFactory
+from utilities.shared_manifests import SharedManifests
+
+# Write log records from a background thread, so logging never blocks request handling.
+configure_logging()
+logger = logging.getLogger(__name__)
 
 # Initialize the Flask application.
 app = Flask(__name__)
 
+# Register the 'low' URL converter, which lowercases case-insensitive route variables during routing.
+app.url_map.converters['low'] = LowercaseConverter
+
 # Path to your OpenAPI YAML file
 OPENAPI_YAML_PATH = os.path.join(os.path.dirname(__file__), 'openapi.yaml')
 
@@ -37,6 +48,75 @@ app.register_blueprint(swagger_ui_blueprint, url_prefix=SWAGGER_URL)
 # Load the plugins into the cache when the application starts.
 plugins_cache = PluginFactory.initialize_manifest_cache()
 
+# Serialize all manifests once into a read-only store shared across worker processes through shared memory,
+# since the plugins cache is never mutated after startup. Single manifests are served as slices of it.
+_MANIFESTS = SharedManifests(plugins_cache)
+
+# Release the parsed manifests, which are only served from the shared store from now on,
+# so every worker keeps just the module path and class name of each plugin in its heap.
+for _cache_model in plugins_cache.values():
+    _cache_model.pop('manifest', None)
+
+# Reusable plugin instances keyed by (plugin type, class name, driver URL, session ID).
+# Bounded, so long-running processes do not retain instances of sessions that ended long ago.
+_PLUGIN_INSTANCES = {}
+_MAX_PLUGIN_INSTANCES = 256
+
+# Thread pool used to run the calls of a batch invocation against distinct driver sessions concurrently.
+# Plugin calls mostly wait on remote WebDriver round-trips, so threads are not limited by the GIL.
+_BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+
+# Parse the configuration at import. Gunicorn does not preload the app (see gunicorn.conf.py), so each worker
+# imports the app and parses the file itself.
+toml_config = load_config()
+
+
+def _json_response(obj):
+    """
+    Serializes an object to JSON using orjson and wraps it in a Flask response.
+
+    Plugin output may hold any value jsonify accepts (e.g. non-string keys or decimals), so the object
+    is serialized with `dump_json`, which handles the same values.
+
+    Args:
+        obj: The JSON-serializable object to return.
+
+    Returns:
+        Response: A response with the serialized object and an 'application/json' mimetype.
+    """
+    return app.response_class(dump_json(obj), mimetype='application/json')
+
+
+def _shared_manifests_response(path, read_data):
+    """
+    Creates a JSON response serving a shared manifests file.
+
+    The file is handed to the WSGI server's file wrapper, so it is sent without being copied through
+    the worker (Gunicorn uses sendfile). If the file is not available, the data is read from memory.
+
+    Args:
+        path (Optional[str]): The path of the shared manifests file, or None if there is no file.
+        read_data (Callable[[], bytes]): Returns the file content from memory.
+
+    Returns:
+        Response: A response with the manifests and an 'application/json' mimetype.
+    """
+    if path:
+        try:
+            # Send the file itself, without the file headers send_file adds (Content-Disposition names the
+            # internal shared file), so the response looks the same as the in-memory fallback
+            response = send_file(path, mimetype='application/json', conditional=False, etag=False)
+            for header in ('Content-Disposition', 'Last-Modified', 'Cache-Control'):
+                response.headers.pop(header, None)
+            return response
+        except OSError as e:
+            # The file may have been removed by a newer version of the deployment
+            logger.warning(f"Error sending shared manifests {path}: {e}")
+
+    # Fall back to the data held in memory
+    return app.response_class(read_data(), mimetype='application/json')
+
 
 @app.route('/api/docs/openapi.yaml', methods=['GET'])
 def openapi_spec():
@@ -52,167 +132,234 @@ def get_plugins():
     Retrieves all plugin manifests from the plugins cache.
 
     This endpoint returns a list of all plugin manifests that have been loaded
-    and cached. It handles the retrieval process and returns them as a JSON response.
+    and cached. It handles the retrieval process and returns them as a JSON response,
+    gzip compressed when the client accepts it.
 
     Returns:
         Response: A JSON response containing a list of all plugin manifests.
                   If an error occurs, returns a 404 status code.
     """
     try:
-        # Initialize an empty list to hold all the manifests
-        manifests = []
+        # Return the pre-compressed list of manifests if the client accepts gzip
+        # (with a non-zero quality, since 'gzip;q=0' explicitly refuses it)
+        if request.accept_encodings.quality('gzip') > 0:
+            response = _shared_manifests_response(_MANIFESTS.gzip_path, _MANIFESTS.all_gzip)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            # Return the pre-serialized list of manifests as a JSON response
+            response = _shared_manifests_response(_MANIFESTS.path, _MANIFESTS.all)
 
-        # Loop through the cache of plugins organized by plugin type
-        for plugin_type, cache_models in plugins_cache.items():
-            # Loop through each cached model for the given plugin type
-            for class_name, cache_model in cache_models.items():
-                # Append the manifest associated with the current cache model to the list
-                manifests.append(cache_model['manifest'])
+        # The response body depends on the Accept-Encoding request header
+        response.vary.add('Accept-Encoding')
 
-        # Return the list of manifests as a JSON response
-        return jsonify(manifests)
+        return response
 
     except Exception as e:
         # Log the error for debugging purposes
-        print(f"Error retrieving plugins: {e}")
+        logger.exception(f"Error retrieving plugins: {e}")
 
         # Return a 404 status response in case of any error
         return app.response_class(status=404)
 
 
-@app.route('/api/v4/g4/plugins/type/<plugin_type>/key/<plugin_name>', methods=['GET'])
+@app.route('/api/v4/g4/plugins/type/<low:plugin_type>/key/<low:plugin_name>', methods=['GET'])
 def get_plugin_by_type_and_key(plugin_type, plugin_name):
     """
     Retrieves a specific plugin manifest by its type and key.
 
     Args:
-        plugin_type (str): The type of the plugin.
-        plugin_name (str): The key (class name) of the plugin.
+        plugin_type (str): The type of the plugin, lowercased by the route converter.
+        plugin_name (str): The key (class name) of the plugin, lowercased by the route converter.
 
     Returns:
         Response: A JSON response containing the plugin manifest if found,
                   otherwise a 404 status response if the plugin does not exist.
     """
     try:
-        # Convert plugin type and name to lowercase for case-insensitive comparison
-        plugin_type = plugin_type.lower()
-        plugin_name = plugin_name.lower()
-
-        # Check if the plugin type and name exist in the cache
-        if plugin_type in plugins_cache and plugin_name in plugins_cache[plugin_type]:
-            # Retrieve the manifest associated with the plugin type and name
-            manifest = plugins_cache[plugin_type][plugin_name]["manifest"]
+        # Retrieve the pre-serialized manifest (route variables and cache keys are lowercase)
+        manifest = _MANIFESTS.get(plugin_type, plugin_name)
 
-            # Return the manifest as a JSON response
-            return jsonify(manifest)
-        else:
-            # Return 404 status if the plugin is not found in the cache
+        # Return the manifest if found, otherwise return 404 status
+        if manifest is None:
             return app.response_class(status=404)
 
+        # Return the manifest as a JSON response
+        return app.response_class(manifest, mimetype='application/json')
+
     except Exception as e:
         # Log the error for debugging purposes
-        print(f"Error retrieving plugin {plugin_name} of type {plugin_type}: {e}")
+        logger.exception(f"Error retrieving plugin {plugin_name} of type {plugin_type}: {e}")
 
         # Return 404 status in case of an error
         return app.response_class(status=404)
 
 
-@app.route('/api/v4/g4/plugins/<plugin_name>', methods=['GET'])
+@app.route('/api/v4/g4/plugins/<low:plugin_name>', methods=['GET'])
 def get_plugin(plugin_name):
     """
     Retrieves a specific plugin manifest by its name.
 
     Args:
-        plugin_name (str): The name of the plugin (key/class name) to retrieve.
+        plugin_name (str): The name of the plugin (key/class name) to retrieve, lowercased by the route converter.
 
     Returns:
         Response: A JSON response containing the plugin manifest if found,
                   otherwise returns a 404 status response if the plugin does not exist.
     """
     try:
-        # Convert plugin name to lowercase for case-insensitive comparison
-        plugin_name = plugin_name.lower()
+        # Retrieve the pre-serialized manifest by name
+        manifest = _MANIFESTS.get_by_name(plugin_name)
 
-        # Iterate over the cached plugin types and their associated plugin classes
-        for plugin_type, plugin_classes in plugins_cache.items():
-            # Check if the plugin name exists in the current plugin type's classes
-            if plugin_name in plugin_classes:
-                # Return the manifest of the found plugin
-                return jsonify(plugin_classes[plugin_name]["manifest"])
+        # Return the manifest if found, otherwise return 404 status
+        if manifest is None:
+            return app.response_class(status=404)
 
-        # If plugin is not found, return 404 status
-        return app.response_class(status=404)
+        # Return the manifest as a JSON response
+        return app.response_class(manifest, mimetype='application/json')
 
     except Exception as e:
         # Log the error message for debugging purposes
-        print(f"Error retrieving plugin {plugin_name}: {e}")
+        logger.exception(f"Error retrieving plugin {plugin_name}: {e}")
 
         # Return 404 status in case of an error
         return app.response_class(status=404)
 
 
-@app.route('/api/v4/g4/plugins/<plugin_type>/invoke', methods=['POST'])
-def invoke(plugin_type):
+def _new_plugin_instance(plugin_type, plugin_request):
     """
-    API endpoint to invoke a plugin based on its type and name.
+    Resolves the plugin instance that should handle a plugin invocation request.
 
     Args:
-        plugin_type (str): The type of the plugin to be invoked, extracted from the URL.
+        plugin_type (str): The lowercase type of the plugin to be invoked.
+        plugin_request (dict): The plugin invocation request.
 
     Returns:
-        Response: JSON response from the plugin invocation or 404 error if plugin is not found.
+        Optional[PluginBase]: The plugin instance, or None if the request is invalid or the plugin is not found.
     """
-    # Parse the incoming JSON request
-    plugin_request = request.json
-
     # Ensure 'pluginName' exists in the request entity
-    if 'entity' not in plugin_request or 'pluginName' not in plugin_request['entity']:
-        return app.response_class(status=404)
+    if not isinstance(plugin_request, dict) or 'pluginName' not in plugin_request.get('entity', {}):
+        return None
 
     # Extract the class name and convert to lowercase
     class_name = f"{plugin_request['entity']['pluginName']}".lower()
 
-    # Convert plugin type to lowercase for consistency
-    plugin_type = plugin_type.lower()
-
     # Ensure 'driverUrl' and 'session' are present in the request
     if 'driverUrl' not in plugin_request or 'session' not in plugin_request:
-        return app.response_class(status=404)
+        return None
 
     # Extract driver URL and session ID from the request
     driver_url = plugin_request['driverUrl']
     session_id = plugin_request['session']
 
-    # Mount session using driver URL and session ID
-    driver = mount_session(driver_url, session_id)
+    # Resolve the cache entry for the plugin type and class name in a single lookup
+    cache_model = plugins_cache.get((plugin_type, class_name))
+    if cache_model is None:
+        return None
 
-    # Create a SetupModel instance and assign the driver
-    setup_model = SetupModel()
-    setup_model.driver = driver
+    # Retrieve the plugin class, importing and validating it on first use (None if not a valid plugin)
+    plugin_class = PluginFactory.load_plugin_class(cache_model)
+    if plugin_class is None:
+        return None
 
-    # Check if the plugin type exists in the cache
-    if plugin_type not in plugins_cache:
-        return app.response_class(status=404)
+    # Reuse an existing instance of stateless plugins bound to the same driver session
+    instance_key = (plugin_type, class_name, driver_url, session_id)
+    plugin_instance = _PLUGIN_INSTANCES.get(instance_key) if plugin_class.reusable else None
+
+    if plugin_instance is None:
+        # Mount session using driver URL and session ID
+        driver = mount_session(driver_url, session_id)
+
+        # Create a SetupModel instance and assign the driver
+        setup_model = SetupModel()
+        setup_model.driver = driver
+
+        # Instantiate the plugin class with the setup model
+        plugin_instance: PluginBase = plugin_class(setup_model)
+
+        # Cache reusable instances, evicting the oldest entry when the cache is full
+        if plugin_class.reusable:
+            if len(_PLUGIN_INSTANCES) >= _MAX_PLUGIN_INSTANCES:
+                _PLUGIN_INSTANCES.pop(next(iter(_PLUGIN_INSTANCES)), None)
+            _PLUGIN_INSTANCES[instance_key] = plugin_instance
+
+    return plugin_instance
+
+
+def _send_all(calls):
+    """
+    Sends a sequence of plugin calls one after another.
+
+    Args:
+        calls (list): A list of (index, plugin instance, plugin request) tuples.
+
+    Returns:
+        list: A list of (index, response dictionary) tuples, in the order of the calls.
+    """
+    return [(index, plugin_instance.send(plugin_request).to_dict()) for index, plugin_instance, plugin_request in calls]
 
-    # Check if the class name exists under the plugin type in the cache
-    if class_name not in plugins_cache[plugin_type]:
-        return app.response_class(status=404)
 
-    # Retrieve the plugin class from the cache
-    plugin_class = plugins_cache[plugin_type][class_name]['class']
+@app.route('/api/v4/g4/plugins/<low:plugin_type>/invoke', methods=['POST'])
+def invoke(plugin_type):
+    """
+    API endpoint to invoke a plugin based on its type and name.
+
+    The request body is either a single plugin invocation request, or a batch of requests given
+    as a JSON array (or an object with a 'batch' array). Batch calls sharing a driver session run
+    sequentially in their original order, while calls against distinct sessions run concurrently.
+
+    Args:
+        plugin_type (str): The type of the plugin to be invoked, extracted from the URL and lowercased.
+
+    Returns:
+        Response: JSON response from the plugin invocation (a list of responses for a batch),
+                  or 404 error if a plugin is not found.
+    """
+    # Parse the incoming JSON request
+    plugin_request = request.json
+
+    # Extract the batch of plugin invocation requests, if any
+    if isinstance(plugin_request, list):
+        plugin_requests = plugin_request
+    elif isinstance(plugin_request, dict) and 'batch' in plugin_request:
+        plugin_requests = plugin_request['batch']
+    else:
+        plugin_requests = None
+
+    # Handle a single plugin invocation request
+    if plugin_requests is None:
+        plugin_instance = _new_plugin_instance(plugin_type, plugin_request)
+        if plugin_instance is None:
+            return app.response_class(status=404)
+
+        # Invoke the plugin with the provided request and convert the result to a dictionary
+        response = plugin_instance.send(plugin_request).to_dict()
 
-    # Ensure the plugin class inherits from PluginBase
-    if not issubclass(plugin_class, PluginBase):
+        # Return the JSON response
+        return _json_response(response)
+
+    # Ensure the batch is a list of requests
+    if not isinstance(plugin_requests, list):
         return app.response_class(status=404)
 
-    # Instantiate the plugin class with the setup model
-    plugin_instance: PluginBase = plugin_class(setup_model)
+    # Resolve all plugins up front, so an invalid call fails the batch before anything is invoked,
+    # and group the calls by driver session to preserve their order within each session
+    groups = {}
+    for index, batch_request in enumerate(plugin_requests):
+        plugin_instance = _new_plugin_instance(plugin_type, batch_request)
+        if plugin_instance is None:
+            return app.response_class(status=404)
+
+        group_key = (batch_request['driverUrl'], batch_request['session'])
+        groups.setdefault(group_key, []).append((index, plugin_instance, batch_request))
 
-    # Invoke the plugin with the provided request and convert the result to a dictionary
-    response = plugin_instance.send(plugin_request).to_dict()
+    # Run each session's calls sequentially, and distinct sessions concurrently
+    responses = [None] * len(plugin_requests)
+    for results in _BATCH_EXECUTOR.map(_send_all, groups.values()):
+        for index, response in results:
+            responses[index] = response
 
-    # Return the JSON response
-    return jsonify(response)
+    # Return the list of responses as JSON, in the order of the requests
+    return _json_response(responses)
 
 
 @app.errorhandler(500)
@@ -228,8 +375,8 @@ def internal_error(error):
     Returns:
         Response: A JSON response containing the error details, with HTTP status code 500.
     """
-    # Create an ErrorModel instance with error details.
-    error500 = ErrorModel(
+    # Create an ErrorModel instance with error details (built here, so validation is skipped).
+    error500 = ErrorModel.unchecked(
         status=500,
         route_data={"method": request.method, "path": request.path},
         trace_id=new_trace_id(),
@@ -238,20 +385,20 @@ def internal_error(error):
     )
 
     # Return the error model as JSON with a 500 status code.
-    return jsonify(error500), 500
+    return _json_response(error500.to_dict()), 500
 
 
 if __name__ == '__main__':
-    # Load configuration from TOML file.
-    config_path = os.path.join(os.path.dirname(__file__), 'config.toml')
-    with open(config_path, 'rb') as f:
-        # Load the TOML configuration file.
-        toml_config = tomllib.load(f)
+    # Development entry point. In production, serve the module-level 'app' WSGI callable
+    # with a WSGI server instead (e.g. 'gunicorn -c gunicorn.conf.py app:app').
 
     # Apply server configurations from the loaded TOML file.
     host = toml_config['server'].get('host', '0.0.0.0')
     port = toml_config['server'].get('port', 5000)
-    debug = toml_config['server'].get('debug', False)
+
+    # Debug mode wraps every request in the debugger middleware, so it must be explicitly enabled
+    # through the G4_DEBUG environment variable or the configuration file.
+    debug = f"{os.environ.get('G4_DEBUG', toml_config['server'].get('debug', False))}".lower() in ('1', 'true', 'yes')
 
     # Run the application with loaded configurations.
     app.run(host=host, port=port, debug=debug, use_reloader=False)
@@ -0,0 +1,23 @@
+import multiprocessing
+import os
+import sys
+
+# Make the application packages importable, since Gunicorn loads this file before changing to the app folder.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utilities.config import load_config
+
+# Load the server configuration from the same TOML file (and with the same loader) as the application.
+server_config = load_config().get('server', {})
+
+# Bind to the host and port defined in config.toml.
+bind = f"{server_config.get('host', '0.0.0.0')}:{server_config.get('port', 5000)}"
+
+# Use threaded workers, since plugin invocations are mostly waiting on remote WebDriver calls.
+worker_class = 'gthread'
+workers = int(os.environ.get('G4_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('G4_THREADS', 4))
+
+# Keep preload_app off: each worker imports the app itself. The app starts its logging thread at import,
+# and a thread started in the master would not survive the fork into the workers.
+preload_app = False
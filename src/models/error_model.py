@@ -1,5 +1,8 @@
 from typing import Dict, List, Any
-import json
+
+import orjson
+
+from utilities.common import dump_json
 
 
 class ErrorModel:
@@ -30,6 +33,41 @@ class ErrorModel:
         # Perform post-initialization validations
         self.__post_init__()
 
+    @classmethod
+    def unchecked(
+        cls,
+        status: int,
+        trace_id: str,
+        errors: Dict[str, List[str]],
+        request: Any,
+        route_data: Dict[str, Any]
+    ) -> 'ErrorModel':
+        """
+        Creates an ErrorModel instance without running the post-initialization validations.
+
+        Intended for callers that build the error data themselves (e.g. the 500 handler), where the
+        validation loops are pure overhead. Untrusted data should go through the constructor,
+        `from_dict` or `from_json` instead.
+
+        Args:
+            status (int): The HTTP status code of the response.
+            trace_id (str): A unique identifier for tracing the request.
+            errors (Dict[str, List[str]]): A dictionary containing error messages categorized by keys.
+            request (str): The HTTP request information.
+            route_data (Dict[str, Any]): Additional routing data related to the request.
+
+        Returns:
+            ErrorModel: An instance of ErrorModel populated with the provided values.
+        """
+        error_model = object.__new__(cls)
+        error_model.status = status
+        error_model.trace_id = trace_id
+        error_model.errors = errors
+        error_model.request = request
+        error_model.route_data = route_data
+
+        return error_model
+
     @staticmethod
     def from_json(json_str: str) -> 'ErrorModel':
         """
@@ -45,9 +83,9 @@ class ErrorModel:
             ValueError: If the JSON string cannot be parsed or is invalid.
         """
         try:
-            data = json.loads(json_str)
+            data = orjson.loads(json_str)
             return ErrorModel.from_dict(data)
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON data: {e}") from e
 
     @staticmethod
@@ -91,7 +129,7 @@ class ErrorModel:
         Returns:
             str: A JSON-formatted string representing the ApiResponse.
         """
-        return json.dumps(self.to_dict(), indent=4)
+        return dump_json(self.to_dict(), indent=True).decode()
 
     def __post_init__(self):
         """
@@ -1,7 +1,10 @@
-import json
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 
+import orjson
+
+from utilities.common import dump_json
+
 
 class PluginResponseModel:
     """
@@ -22,10 +25,62 @@ class PluginResponseModel:
         self.application_parameters: Dict[str, str] = {}
         self.data_provider: [Dict[str, Any]] = []
         self.entity: Dict[str, Any] = {}
-        self.exceptions: List[G4ExceptionModel] = []
-        self.extractions: List[G4ExtractionModel] = []
         self.session_parameters: Dict[str, str] = {}
 
+        # Exceptions and extractions, and the raw dictionaries they are lazily materialized from (see from_dict)
+        self._exceptions: List[G4ExceptionModel] = []
+        self._extractions: List[G4ExtractionModel] = []
+        self._raw_exceptions: Optional[List[Dict[str, Any]]] = None
+        self._raw_extractions: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def exceptions(self) -> List['G4ExceptionModel']:
+        """
+        Gets the exceptions list, materializing any raw exception dictionaries on first access.
+
+        Returns:
+            List[G4ExceptionModel]: The list of exceptions encountered during plugin execution.
+        """
+        if self._raw_exceptions is not None:
+            self._exceptions = [G4ExceptionModel(**exception) for exception in self._raw_exceptions]
+            self._raw_exceptions = None
+        return self._exceptions
+
+    @exceptions.setter
+    def exceptions(self, value: List['G4ExceptionModel']):
+        """
+        Sets the exceptions list, discarding any raw exception dictionaries.
+
+        Args:
+            value (List[G4ExceptionModel]): The list of exceptions.
+        """
+        self._exceptions = value
+        self._raw_exceptions = None
+
+    @property
+    def extractions(self) -> List['G4ExtractionModel']:
+        """
+        Gets the extractions list, materializing any raw extraction dictionaries on first access.
+
+        Returns:
+            List[G4ExtractionModel]: The list of extractions performed by the plugin.
+        """
+        if self._raw_extractions is not None:
+            self._extractions = [G4ExtractionModel(**extraction) for extraction in self._raw_extractions]
+            self._raw_extractions = None
+        return self._extractions
+
+    @extractions.setter
+    def extractions(self, value: List['G4ExtractionModel']):
+        """
+        Sets the extractions list, discarding any raw extraction dictionaries.
+
+        Args:
+            value (List[G4ExtractionModel]): The list of extractions.
+        """
+        self._extractions = value
+        self._raw_extractions = None
+
     @staticmethod
     def from_json(json_str: str) -> 'PluginResponseModel':
         """
@@ -42,12 +97,12 @@ class PluginResponseModel:
         """
         try:
             # Parse the JSON string into a dictionary
-            data = json.loads(json_str)
+            data = orjson.loads(json_str)
 
             # Convert the dictionary into a PluginResponseModel instance
             return PluginResponseModel.from_dict(data)
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             # Raise a ValueError if the JSON string is invalid
             raise ValueError(f"Invalid JSON data: {e}") from e
 
@@ -65,11 +120,16 @@ class PluginResponseModel:
         # Initialize a new PluginResponseModel object
         response = PluginResponseModel()
 
-        # Convert and populate the exceptions and extractions lists from the data
+        # Populate the data provider and entity from the data
         response.data_provider = data.get("dataProvider", [])
         response.entity = data.get("entity", {})
-        response.exceptions = [G4ExceptionModel(**exception) for exception in data.get("exceptions", [])]
-        response.extractions = [G4ExtractionModel(**extraction) for extraction in data.get("extractions", [])]
+
+        # Keep the raw exceptions and extractions; they are converted to models only when accessed
+        # (including by to_dict), after checking here that they can be converted
+        response._raw_exceptions = PluginResponseModel.__validate_entries(
+            G4ExceptionModel, data.get("exceptions", []))
+        response._raw_extractions = PluginResponseModel.__validate_entries(
+            G4ExtractionModel, data.get("extractions", []))
 
         # Populate application and session parameters from the data
         response.application_parameters = data.get("applicationParameters", {})
@@ -77,6 +137,30 @@ class PluginResponseModel:
 
         return response
 
+    @staticmethod
+    def __validate_entries(model_class: type, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Checks that raw dictionaries can be converted to the given model, without converting them.
+
+        Entries whose keys are all fields of the model are accepted as is. Any other entry is converted,
+        so it raises the same TypeError an eager conversion would.
+
+        Args:
+            model_class (type): The dataclass model the entries are converted to.
+            entries (List[Dict[str, Any]]): The raw dictionaries.
+
+        Returns:
+            List[Dict[str, Any]]: The entries.
+
+        Raises:
+            TypeError: If an entry is not a dictionary of the model fields.
+        """
+        fields = model_class.__dataclass_fields__
+        for entry in entries:
+            if not isinstance(entry, dict) or not entry.keys() <= fields.keys():
+                model_class(**entry)
+        return entries
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Converts the PluginResponseModel instance into a dictionary.
@@ -95,27 +179,13 @@ class PluginResponseModel:
                 - sessionParameters: Session-specific parameters.
         """
 
-        # Initialize an empty list to store converted exceptions
-        exceptions = []
-
-        # Convert each exception in the list to a dictionary and add to exceptions list
-        for exception in self.exceptions:
-            exceptions.append(exception.__dict__())
-
-        # Initialize an empty list to store converted extractions
-        extractions = []
-
-        # Convert each extraction in the list to a dictionary and add to extractions list
-        for extraction in self.extractions:
-            extractions.append(extraction.__dict__())
-
         # Return a dictionary containing all attributes of PluginResponseModel
         return {
             "applicationParameters": self.application_parameters,
             "dataProvider": self.data_provider,
             "entity": self.entity,
-            "exceptions": exceptions,
-            "extractions": extractions,
+            "exceptions": [exception.to_dict() for exception in self.exceptions],
+            "extractions": [extraction.to_dict() for extraction in self.extractions],
             "sessionParameters": self.session_parameters
         }
 
@@ -127,17 +197,17 @@ class PluginResponseModel:
             str: A pretty-printed JSON string representing the model's data.
         """
         # Convert the model to a dictionary and format it as a pretty JSON string
-        return json.dumps(self.to_dict(), indent=4)
+        return dump_json(self.to_dict(), indent=True).decode()
 
 
-@dataclass
+@dataclass(slots=True)
 class G4EntityModel:
     """Describes a contract for receiving G4 entity information from G4 service."""
     content: Dict[str, Any] = field(default_factory=dict)
     iteration: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class G4ExceptionModel:
     """Describes a contract for receiving G4 exceptions data."""
     data: [Dict[str, Any]] = field(default_factory=dict)
@@ -147,9 +217,10 @@ class G4ExceptionModel:
     reason_phrase: str = ''
     screenshot: Optional['ScreenshotModel'] = None
     type: Optional[str] = None
+    message: str = ''
 
     # Convert the G4ExceptionModel instance to a dictionary
-    def __dict__(self):
+    def to_dict(self) -> Dict[str, Any]:
         return {
             "data": self.data,
             "iteration": self.iteration,
@@ -161,7 +232,7 @@ class G4ExceptionModel:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class G4SessionModel:
     """Describes a contract for receiving G4Session information from G4™ Service."""
     id: str = ''
@@ -173,7 +244,7 @@ class G4SessionModel:
         self.machine_ip = machine_ip
         self.machine_name = machine_name
 
-    def __dict__(self):
+    def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "machineIp": self.machine_ip,
@@ -181,7 +252,7 @@ class G4SessionModel:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class G4ExtractionModel:
     """Represents a model for G4 extraction."""
     entities: List[G4EntityModel] = field(default_factory=list)
@@ -190,16 +261,16 @@ class G4ExtractionModel:
     session: Optional[G4SessionModel] = None
 
     # Convert the G4ExtractionModel instance to a dictionary
-    def __dict__(self):
+    def to_dict(self) -> Dict[str, Any]:
         return {
             "entities": self.entities,
             "key": self.key,
             "reference": self.reference,
-            "session": self.session.__dict__()
+            "session": self.session.to_dict() if self.session else None
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenshotModel:
     """Describes a contract for receiving screenshot data."""
     name: str = ''
@@ -1,8 +1,51 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from selenium.webdriver.remote.webdriver import WebDriver
+# Selenium is imported on first use of the wait property, so importing the model does not load it.
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.support.wait import WebDriverWait
 
 
 class SetupModel:
     def __init__(self):
-        self.driver: Optional[WebDriver] = None
+        self._driver: Optional['WebDriver'] = None
+        self._wait: Optional['WebDriverWait'] = None
+
+    @property
+    def driver(self) -> Optional['WebDriver']:
+        """
+        Gets the WebDriver instance used by the plugin.
+
+        Returns:
+            Optional[WebDriver]: The WebDriver instance, or None if no driver was assigned.
+        """
+        return self._driver
+
+    @driver.setter
+    def driver(self, value: Optional['WebDriver']):
+        """
+        Sets the WebDriver instance and discards any wait object bound to the previous driver.
+
+        Args:
+            value (Optional[WebDriver]): The WebDriver instance to assign.
+        """
+        self._driver = value
+        self._wait = None
+
+    @property
+    def wait(self) -> Optional['WebDriverWait']:
+        """
+        Gets a WebDriverWait (10 seconds timeout) bound to the current driver.
+
+        The wait object is created on first access and reused for subsequent calls,
+        until a new driver is assigned.
+
+        Returns:
+            Optional[WebDriverWait]: The wait object, or None if no driver was assigned.
+        """
+        if self._wait is None and self._driver is not None:
+            # Import Selenium on first use.
+            from selenium.webdriver.support.wait import WebDriverWait
+
+            self._wait = WebDriverWait(self._driver, 10)
+        return self._wait
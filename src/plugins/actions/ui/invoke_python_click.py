@@ -1,10 +1,30 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import wait, expected_conditions
+from selenium.webdriver.support import expected_conditions
 
 from models.plugin_response_model import PluginResponseModel
 from models.setup_model import SetupModel
 from plugins.plugin_base import PluginBase
 
+# Resolve the expected condition factory once instead of on every invocation
+_presence_of_element_located = expected_conditions.presence_of_element_located
+
+# Map of lowercase G4 locator names (and common short aliases) to Selenium locator strategies
+_BY_MAP = {
+    "xpath": By.XPATH,
+    "cssselector": By.CSS_SELECTOR,
+    "css": By.CSS_SELECTOR,
+    "id": By.ID,
+    "name": By.NAME,
+    "classname": By.CLASS_NAME,
+    "class": By.CLASS_NAME,
+    "tagname": By.TAG_NAME,
+    "tag": By.TAG_NAME,
+    "linktext": By.LINK_TEXT,
+    "link": By.LINK_TEXT,
+    "partiallinktext": By.PARTIAL_LINK_TEXT,
+    "partial-link": By.PARTIAL_LINK_TEXT
+}
+
 
 class InvokePythonClick(PluginBase):
     """
@@ -22,6 +42,9 @@ class InvokePythonClick(PluginBase):
         a PluginResponseModel.
     """
 
+    # The plugin keeps no per-invocation state, so its instances can be reused
+    reusable = True
+
     def __init__(self, plugin_setup_model: SetupModel):
         """
         Initializes the InvokePythonClick plugin with the provided setup model.
@@ -45,17 +68,16 @@ class InvokePythonClick(PluginBase):
         # Extract the rule (contains information about the element to be clicked)
         rule = action_request["entity"]
 
-        # Determine the locator type (default to XPath if locator_type is not specified in the rule)
-        locator_type = 'xpath' if not rule["locator"] else PluginBase.convert_to_space_case(f'{rule["locator"]}')
+        # Determine the locator type (default to XPath if locator is not specified in the rule).
+        # Unknown locators fall back to their space case form (e.g. 'CssSelector' -> 'css selector').
+        locator_name = f'{rule.get("locator") or "xpath"}'
+        locator_type = _BY_MAP.get(locator_name.lower()) or PluginBase.convert_to_space_case(locator_name)
 
         # Create a locator tuple based on the locator type and the element's identifier (onElement)
         locator = (locator_type, f'{rule["onElement"]}')
 
-        # Initialize a WebDriverWait instance to wait for the element to be present on the page (max wait: 10 seconds)
-        driver_wait = wait.WebDriverWait(self.plugin_setup_model.driver, 10)
-
-        # Wait until the element is located and present on the DOM
-        element = driver_wait.until(expected_conditions.presence_of_element_located(locator))
+        # Wait until the element is located and present on the DOM, reusing the driver's wait (max wait: 10 seconds)
+        element = self.plugin_setup_model.wait.until(_presence_of_element_located(locator))
 
         # Click the located element
         element.click()
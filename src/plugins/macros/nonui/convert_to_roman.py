@@ -1,6 +1,42 @@
 from models.plugin_response_model import PluginResponseModel
 from plugins.plugin_base import PluginBase
 
+# Roman numeral symbols for each decimal digit, by position (thousands, hundreds, tens and units)
+_THOUSANDS = ('', 'M', 'MM', 'MMM')
+_HUNDREDS = ('', 'C', 'CC', 'CCC', 'CD', 'D', 'DC', 'DCC', 'DCCC', 'CM')
+_TENS = ('', 'X', 'XX', 'XXX', 'XL', 'L', 'LX', 'LXX', 'LXXX', 'XC')
+_UNITS = ('', 'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX')
+
+
+# Roman numerals of every number from 0 to 3999 (0 maps to an empty string), composed once at import time
+_NUMERALS = tuple(
+    _THOUSANDS[number // 1000] + _HUNDREDS[number // 100 % 10] + _TENS[number // 10 % 10] + _UNITS[number % 10]
+    for number in range(4000)
+)
+
+
+def _to_roman(number: int) -> str:
+    """
+    Converts an integer to its Roman numeral representation.
+
+    All numerals are precomputed, so a conversion is a range check and a single tuple index.
+
+    Args:
+        number (int): The integer to convert, between 1 and 3999.
+
+    Returns:
+        str: The Roman numeral representation of the number.
+
+    Raises:
+        ValueError: If the number is outside the 1-3999 range.
+    """
+    # Ensure the value can be represented with standard Roman numerals
+    if not 0 < number < 4000:
+        raise ValueError(f"Number must be between 1 and 3999, got {number}")
+
+    # Look up the precomputed numeral
+    return _NUMERALS[number]
+
 
 class ConvertToRoman(PluginBase):
     """
@@ -13,6 +49,9 @@ class ConvertToRoman(PluginBase):
         plugin_setup_model (SetupModel): The setup model which contains the necessary configurations.
     """
 
+    # The plugin keeps no per-invocation state, so its instances can be reused
+    reusable = True
+
     def __init__(self, plugin_setup_model):
         """
         Initializes the ConvertToRoman plugin with the provided setup model.
@@ -32,42 +71,20 @@ class ConvertToRoman(PluginBase):
         Returns:
             PluginResponseModel: A response model with the Roman numeral result stored in the 'MacroResult' key.
         """
-        # Extract the integer value from the action request
-        # Convert the value to an integer
-        number = int(f"{action_request['arguments']['Number']}")
-
-        # Lists of decimal values and their corresponding Roman numeral symbols
-        values = [
-            1000, 900, 500, 400,
-            100, 90, 50, 40,
-            10, 9, 5, 4,
-            1
-        ]
-        symbols = [
-            'M', 'CM', 'D', 'CD',
-            'C', 'XC', 'L', 'XL',
-            'X', 'IX', 'V', 'IV',
-            'I'
-        ]
-
-        # Initialize an empty string to hold the Roman numeral result
-        roman_num = ''
-
-        # Index for iterating over the values and symbols lists
-        i = 0
-
-        # Loop to build the Roman numeral by subtracting values from num
-        while number > 0:
-            count = number // values[i]      # Determine how many times values[i] fits into num
-            roman_num += symbols[i] * count  # Append the Roman numeral symbol corresponding to values[i]
-            number -= values[i] * count      # Subtract the value from num
-            i += 1                           # Move to the next Roman numeral symbol
+        # Extract the value from the action request
+        value = action_request['arguments']['Number']
+
+        # Convert the value to an integer; integers are used as is, and any other value is parsed from its string
+        # form, so non-integral values (e.g. 3.7 or True) are rejected instead of being truncated
+        number = value if type(value) is int else int(str(value))
+
+        # Convert the number to its Roman numeral representation (precomputed)
+        roman_num = _to_roman(number)
 
         # Create the response model and store the Roman numeral result in the 'MacroResult' key
+        # of its (initially empty) entity, instead of replacing the entity with a new dictionary
         response = PluginResponseModel()
-        response.entity = {
-            "MacroResult": roman_num
-        }
+        response.entity["MacroResult"] = roman_num
 
         # Return the response model with the Roman numeral result
         return response
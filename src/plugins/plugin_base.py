@@ -8,6 +8,10 @@ import traceback
 
 
 class PluginBase(ABC):
+    # Set to True in plugins that keep no per-invocation state, so a single instance
+    # can be reused across invocations against the same driver session.
+    reusable = False
+
     def __init__(self, plugin_setup_model: SetupModel):
         self.plugin_setup_model = plugin_setup_model
 
@@ -51,15 +55,18 @@ class PluginBase(ABC):
             # Create an exception model to capture error details
             exception_model = G4ExceptionModel()
 
+            # Get the entity of the action request once for the lookups below
+            entity = action_request.get('entity') or {}
+
             # Populate the exception model with relevant information from the action request
             exception_model.data = {
                 'message': str(e),
-                'stackTrace': traceback.format_exc()
+                'stackTrace': ''.join(traceback.format_exception(e))
             }
-            exception_model.plugin_name = action_request.get('entity', {}).get('pluginName', 'ExternalPlugin')
+            exception_model.plugin_name = entity.get('pluginName', 'ExternalPlugin')
             exception_model.message = str(e)
-            exception_model.reference = action_request.get('entity', {}).get('reference', None)
-            exception_model.iteration = action_request.get('entity', {}).get('iteration', 0)
+            exception_model.reference = entity.get('reference')
+            exception_model.iteration = entity.get('iteration', 0)
             exception_model.type = type(e).__name__
 
             # Prepare a response model to return the exception
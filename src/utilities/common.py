@@ -1,62 +1,161 @@
+import atexit
+import dataclasses
+import decimal
+import functools
 import json
+import logging
 import os
+import queue
+import random
 import re
 import secrets
 import string
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.remote.webdriver import WebDriver
+import orjson
+from werkzeug.http import http_date
 
+# Selenium is imported on first use in mount_session, so importing the helpers of this module does not load it.
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
-def convert_to_camel_case(obj):
+# Matches the position before each capital letter, except at the start of the string.
+_CAMEL_SPLIT = re.compile(r'(?<!^)(?=[A-Z])')
+
+# The orjson options of dump_json: non-string keys are converted to strings as the standard library does,
+# and dates are passed to _json_default, so they are formatted as HTTP dates like Flask's jsonify does.
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# The characters of the random part of trace IDs, and the OS-backed generator picking them.
+_TRACE_POOL = string.ascii_uppercase + string.digits
+_SYSRAND = random.SystemRandom()
+
+# The listener writing queued log records, set once logging is configured.
+_log_listener = None
+
+
+def configure_logging(level: int = logging.INFO) -> QueueListener:
     """
-    Recursively converts dictionary keys from snake_case to camelCase.
+    Configures the root logger to enqueue log records and write them from a background thread.
+
+    Request handlers only put a reference to the record on a queue, while a QueueListener thread
+    formats and writes it to stderr, so the write never blocks the request path. The listener is
+    stopped (and the queue flushed) when the process exits. Subsequent calls return the existing listener.
 
     Args:
-        obj: The object to convert. Can be a dict, list, or other type.
+        level (int): The root logger level. Defaults to logging.INFO.
 
     Returns:
-        The converted object with all dictionary keys in camelCase.
+        QueueListener: The listener writing the queued log records.
     """
+    global _log_listener
 
-    def format_camel_case(snake_str: str) -> str:
-        """
-        Converts a snake_case string to camelCase.
+    # Configure logging only once per process
+    if _log_listener is not None:
+        return _log_listener
 
-        Args:
-            snake_str (str): The snake_case string to convert.
+    # Create the handler that actually writes the records, used by the background listener
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
 
-        Returns:
-            str: The converted camelCase string.
-        """
-        # Split the snake_case string into components.
-        components = snake_str.split('_')
-        # Combine the first component with the title-cased subsequent components.
-        return components[0] + ''.join(x.title() for x in components[1:])
-
-    # Check if the object is a list.
-    if isinstance(obj, list):
-        # Recursively convert each item in the list.
-        return [convert_to_camel_case(o) for o in obj]
-    # Check if the object is a dictionary.
-    elif isinstance(obj, dict):
-        # Create a new dictionary to store converted keys and values.
-        new_dictionary = {}
-        for key, value in obj.items():
-            # Convert the key to camelCase.
-            new_key = format_camel_case(key)
-            # Recursively convert the value.
-            new_dictionary[new_key] = convert_to_camel_case(value)
-        return new_dictionary
-    else:
-        # Return the object as is if it's neither a list nor a dict.
+    # Route all root logger records through the queue
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+    # Start the background listener and stop it when the process exits
+    _log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    return _log_listener
+
+
+def _convert_keys(obj, format_key):
+    """
+    Converts the keys of all dictionaries nested in an object, in place.
+
+    The object graph is walked iteratively with an explicit stack instead of recursion, so deeply
+    nested objects do not hit the recursion limit, and no new dictionaries or lists are allocated.
+    Key order is preserved, and containers referenced more than once are converted only once.
+
+    Args:
+        obj: The object to convert. Can be a dict, list, or other type.
+        format_key (Callable[[str], str]): The function converting a single key.
+
+    Returns:
+        The same object, with all dictionary keys converted.
+    """
+    # Return the object as is if it's neither a list nor a dict.
+    if not isinstance(obj, (dict, list)):
         return obj
 
+    stack = deque([obj])
+    visited = set()
+
+    while stack:
+        current = stack.pop()
+
+        # Skip containers that were already converted
+        if id(current) in visited:
+            continue
+        visited.add(id(current))
+
+        if isinstance(current, dict):
+            # Re-insert all entries under the converted keys, preserving their order
+            items = list(current.items())
+            current.clear()
+            for key, value in items:
+                current[format_key(key)] = value
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+        else:
+            # Push the nested containers of the list
+            stack.extend(item for item in current if isinstance(item, (dict, list)))
+
+    return obj
+
+
+def _read_json(file_path: str):
+    """
+    Reads and parses a JSON file.
+
+    Args:
+        file_path (str): The path of the JSON file.
+
+    Returns:
+        Any: The parsed JSON content.
+    """
+    with open(file_path, 'rb') as opened_file:
+        return orjson.loads(opened_file.read())
+
+
+def convert_to_camel_case(obj):
+    """
+    Converts dictionary keys from snake_case to camelCase, in all nested dictionaries and lists.
+
+    Dictionaries are converted in place, so the input object is modified and returned.
+
+    Args:
+        obj: The object to convert. Can be a dict, list, or other type.
+
+    Returns:
+        The converted object with all dictionary keys in camelCase.
+    """
+    return _convert_keys(obj, format_camel_case)
+
 
 def convert_to_snake_case(obj):
     """
-    Recursively converts dictionary keys from camelCase to snake_case.
+    Converts dictionary keys from camelCase to snake_case, in all nested dictionaries and lists.
+
+    Dictionaries are converted in place, so the input object is modified and returned.
 
     Args:
         obj: The object to convert. Can be a dict, list, or other type.
@@ -64,38 +163,143 @@ def convert_to_snake_case(obj):
     Returns:
         The converted object with all dictionary keys in snake_case.
     """
+    return _convert_keys(obj, format_snake_case)
 
-    def format_snake_case(camel_str: str) -> str:
-        """
-        Converts a camelCase string to snake_case.
 
-        Args:
-            camel_str (str): The camelCase string to convert.
+def dump_json(obj, indent: bool = False) -> bytes:
+    """
+    Serializes an object to JSON with orjson, accepting the same values as Flask's jsonify.
+
+    Non-string dictionary keys are converted to strings, and dates, decimals, UUIDs and objects with
+    an __html__ method are serialized by `_json_default`. Values orjson can not serialize at all (for
+    example integers wider than 64 bits) fall back to the standard library json module.
 
-        Returns:
-            str: The converted snake_case string.
-        """
-        # Insert an underscore before each capital letter and convert to lowercase.
-        snake_str = re.sub(r'(?<!^)(?=[A-Z])', '_', camel_str).lower()
+    Args:
+        obj: The object to serialize.
+        indent (bool): Whether to pretty-print the JSON with an indentation of two spaces.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON.
+
+    Raises:
+        TypeError: If the object contains a value that can not be serialized.
+    """
+    try:
+        # Serialize with orjson, indenting only when requested.
+        return orjson.dumps(obj, default=_json_default, option=_JSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0))
+    except TypeError:
+        # Fall back to the standard library for values orjson does not support.
+        return json.dumps(obj, default=_json_default, indent=2 if indent else None).encode()
+
+
+def _json_default(obj):
+    """
+    Converts values without a native JSON representation, the same way Flask's default JSON provider does.
+
+    Args:
+        obj: The value to convert.
+
+    Returns:
+        Any: A JSON-serializable representation of the value.
+
+    Raises:
+        TypeError: If the value type is not supported.
+    """
+    # Format dates (and datetimes) as HTTP dates.
+    if isinstance(obj, date):
+        return http_date(obj)
+
+    # Serialize decimals and UUIDs as strings.
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+
+    # Serialize dataclasses as dictionaries (reached by the standard library fallback only).
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+
+    # Serialize HTML-safe objects (e.g. markupsafe.Markup) as their HTML.
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@functools.lru_cache(maxsize=8192)
+def format_camel_case(snake_str: str) -> str:
+    """
+    Converts a snake_case string to camelCase.
+
+    Results are memoized, since the same keys appear across many converted objects.
+
+    Args:
+        snake_str (str): The snake_case string to convert.
+
+    Returns:
+        str: The converted camelCase string.
+    """
+    # Return keys without underscores as is, without splitting them.
+    index = snake_str.find('_')
+    if index < 0:
         return snake_str
 
-    # Check if the object is a list.
-    if isinstance(obj, list):
-        # Recursively convert each item in the list.
-        return [convert_to_snake_case(item) for item in obj]
-    # Check if the object is a dictionary.
-    elif isinstance(obj, dict):
-        # Create a new dictionary to store converted keys and values.
-        new_dictionary = {}
-        for key, value in obj.items():
-            # Convert the key to snake_case.
-            new_key = format_snake_case(key)
-            # Recursively convert the value.
-            new_dictionary[new_key] = convert_to_snake_case(value)
-        return new_dictionary
-    else:
-        # Return the object as is if it's neither a list nor a dict.
-        return obj
+    # Combine the first component with the title-cased subsequent components.
+    return snake_str[:index] + ''.join(x.title() for x in snake_str[index + 1:].split('_'))
+
+
+@functools.lru_cache(maxsize=8192)
+def format_snake_case(camel_str: str) -> str:
+    """
+    Converts a camelCase string to snake_case.
+
+    Results are memoized, since the same keys appear across many converted objects.
+
+    Args:
+        camel_str (str): The camelCase string to convert.
+
+    Returns:
+        str: The converted snake_case string.
+    """
+    # Return keys without capital letters as is, without scanning them with the regex.
+    if camel_str.islower():
+        return camel_str
+
+    # Insert an underscore before each capital letter and convert to lowercase.
+    return _CAMEL_SPLIT.sub('_', camel_str).lower()
+
+
+def iter_files(folder: str, suffixes):
+    """
+    Recursively yields the files under a folder whose names end with the given suffixes.
+
+    The tree is traversed with `os.scandir`, whose entries carry the file type from the directory
+    listing, so no separate stat call is needed to tell files from folders. Like `os.walk`, the files
+    of a folder are yielded before descending into its subfolders, and symbolic links to folders are
+    not followed.
+
+    Args:
+        folder (str): The folder to traverse. A missing folder yields nothing.
+        suffixes (Union[str, tuple]): The file name suffix, or tuple of suffixes, to match (e.g. '.json').
+
+    Yields:
+        os.DirEntry: The directory entry of each matching file.
+    """
+    # Collect the subfolders, so they are traversed after the files of the current folder.
+    subfolders = []
+
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry.path)
+                elif entry.name.endswith(suffixes) and entry.is_file():
+                    yield entry
+    except OSError:
+        # Skip folders that do not exist or can not be read, as os.walk does.
+        return
+
+    # Traverse the subfolders.
+    for subfolder in subfolders:
+        yield from iter_files(subfolder, suffixes)
 
 
 def load_plugins(manifests_path: str) -> dict:
@@ -111,38 +315,76 @@ def load_plugins(manifests_path: str) -> dict:
     # Initialize the cache for plugins.
     plugins_cache = {}
 
-    # Walk through the directory tree starting at manifests_path.
-    for dir_path, dir_names, filenames in os.walk(manifests_path):
-        for filename in filenames:
-            # Skip files that are not JSON.
-            if not filename.endswith('.json'):
-                continue
-
-            # Construct the full file path.
-            file_path = os.path.join(dir_path, filename)
-            with open(file_path, 'r') as opened_file:
-                # Load the JSON content.
-                content = json.load(opened_file)
-                # Get the plugin type and name from the content.
-                plugin_type = content.get('pluginType', '').lower()
-                plugin_name = content.get('key')
-
-                if plugin_type and plugin_name:
-                    # Initialize the plugin type category if not already present.
-                    if plugin_type not in plugins_cache:
-                        plugins_cache[plugin_type] = {}
-                    # Add the plugin to the cache.
-                    plugins_cache[plugin_type][plugin_name] = content
+    # Organize the manifests found under manifests_path by plugin type.
+    for content in scan_manifests(manifests_path):
+        # Get the plugin type and name from the content.
+        plugin_type = content.get('pluginType', '').lower()
+        plugin_name = content.get('key')
+
+        if plugin_type and plugin_name:
+            # Initialize the plugin type category if not already present.
+            if plugin_type not in plugins_cache:
+                plugins_cache[plugin_type] = {}
+            # Add the plugin to the cache.
+            plugins_cache[plugin_type][plugin_name] = content
     return plugins_cache
 
 
-def mount_session(url: str, session_id: str) -> WebDriver:
+@functools.cache
+def _new_session_remote_class() -> type:
+    """
+    Creates the remote WebDriver class used by `mount_session`, importing Selenium on first call.
+
+    Returns:
+        type: A `webdriver.Remote` subclass that attaches to an existing session instead of creating a new one.
+    """
+    # Import Selenium on first use.
+    from selenium import webdriver
+
+    class _SessionRemote(webdriver.Remote):
+        """
+        A remote WebDriver that attaches to an existing session instead of creating a new one.
+        """
+
+        def __init__(self, session_id: str, **kwargs):
+            """
+            Initializes the remote WebDriver for an existing session.
+
+            Args:
+                session_id (str): The session ID of the existing WebDriver session to attach to.
+                **kwargs: The arguments passed to `webdriver.Remote`.
+            """
+            # Store the session ID before the base initializer starts the session.
+            self._existing_session_id = session_id
+            super().__init__(**kwargs)
+
+        def start_session(self, capabilities: dict) -> None:
+            """
+            Adopts the existing session ID instead of sending a 'newSession' command to the server.
+
+            Args:
+                capabilities (dict): The capabilities of the driver options (unused).
+            """
+            self.session_id = self._existing_session_id
+            self.caps = {}
+
+    return _SessionRemote
+
+
+@functools.lru_cache(maxsize=256)
+def mount_session(url: str, session_id: str) -> 'WebDriver':
     """
     Reconstructs a WebDriver session given the URL of the remote WebDriver server and a session ID.
 
     This function is useful when you need to reconnect to an existing WebDriver session,
     for example, after a crash or when reusing sessions for performance reasons.
 
+    The driver is created through a WebDriver subclass that adopts the session ID instead of
+    starting a new session, so no global state is patched and concurrent calls are thread-safe.
+
+    The returned WebDriver is cached per (url, session_id), so repeated calls for the same session
+    reuse the same instance and its pooled HTTP connections to the remote WebDriver server.
+
     Args:
         url (str): The URL of the remote WebDriver server (e.g., "http://localhost:4444/wd/hub").
         session_id (str): The session ID of the existing WebDriver session to reconnect to.
@@ -150,34 +392,11 @@ def mount_session(url: str, session_id: str) -> WebDriver:
     Returns:
         WebDriver: A WebDriver instance connected to the existing session.
     """
-    # Backup the original WebDriver.execute method.
-    execute = WebDriver.execute
-
-    def local_executor(self, command, params=None):
-        """
-        Overrides the execute method to intercept the 'newSession' command.
+    # Import Selenium on first use.
+    from selenium.webdriver.chrome.options import Options
 
-        If the command is not 'newSession', it calls the original execute method.
-        If the command is 'newSession', it returns a response with the provided session ID.
-        """
-        if command != "newSession":
-            # Use the original execute method for all commands except 'newSession'.
-            return execute(self, command, params)
-
-        # Mimic a successful 'newSession' command by returning the existing session ID.
-        return {'success': 0, 'value': {}, 'sessionId': session_id}
-
-    # Override the WebDriver.execute method with the local executor.
-    WebDriver.execute = local_executor
-
-    # Initialize a new WebDriver instance using the overridden execute method.
-    new_driver = webdriver.Remote(command_executor=url, options=Options())
-
-    # Manually set the session ID to the existing session.
-    new_driver.session_id = session_id
-
-    # Restore the original WebDriver.execute method.
-    WebDriver.execute = execute
+    # Attach a new WebDriver instance to the existing session, without sending a 'newSession' command.
+    new_driver = _new_session_remote_class()(command_executor=url, session_id=session_id, options=Options())
 
     # Return the WebDriver instance connected to the existing session.
     return new_driver
@@ -197,9 +416,7 @@ def new_trace_id() -> str:
     # Number of random characters after 'PTN'.
     random_length = 10
     # Generate a string of random uppercase letters and digits.
-    random_chars = ''.join(
-        secrets.choice(string.ascii_uppercase + string.digits) for _ in range(random_length)
-    )
+    random_chars = ''.join(_SYSRAND.choices(_TRACE_POOL, k=random_length))
 
     # Generates a number between 0 and 99,999,999.
     number = secrets.randbelow(100000000)
@@ -209,3 +426,25 @@ def new_trace_id() -> str:
 
     # Returns the generated trace ID with the format 'PTNxxxxxxxxxx:00000001'.
     return trace_id
+
+
+def scan_manifests(manifests_path: str) -> list:
+    """
+    Scans a directory tree once and parses every plugin manifest (JSON file) found in it.
+
+    This is the single manifests scan shared by `load_plugins` and `PluginFactory.initialize_manifest_cache`,
+    so the manifests tree is walked and parsed only once when both structures are needed. The files are
+    read and parsed concurrently, overlapping the disk latency of the individual reads.
+
+    Args:
+        manifests_path (str): The path to the directory containing plugin manifests.
+
+    Returns:
+        list: The parsed manifests, in directory walk order.
+    """
+    # Collect the paths of all JSON files in the directory tree starting at manifests_path.
+    paths = [entry.path for entry in iter_files(manifests_path, '.json')]
+
+    # Read and parse the manifest files concurrently, keeping the walk order of the results.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return list(executor.map(_read_json, paths))
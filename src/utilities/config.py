@@ -0,0 +1,40 @@
+import functools
+import os
+import tomllib
+
+# Path to the server configuration TOML file
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.toml')
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(path, mtime_ns):
+    """
+    Loads and parses a TOML configuration file.
+
+    The result is memoized by path and modification time, so the file is parsed only once
+    unless it changes on disk.
+
+    Args:
+        path (str): The path to the TOML configuration file.
+        mtime_ns (int): The file modification time in nanoseconds, used as the cache invalidation key.
+
+    Returns:
+        dict: The parsed TOML configuration.
+    """
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
+
+
+def load_config(path=CONFIG_PATH):
+    """
+    Returns the parsed configuration, re-parsing the file only when its modification time changes.
+
+    Shared by the application and the Gunicorn configuration (gunicorn.conf.py), so both read the same settings.
+
+    Args:
+        path (str): The path to the TOML configuration file. Defaults to CONFIG_PATH.
+
+    Returns:
+        dict: The parsed TOML configuration.
+    """
+    return _load_config(path, os.stat(path).st_mtime_ns)
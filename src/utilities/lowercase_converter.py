@@ -0,0 +1,22 @@
+from werkzeug.routing import BaseConverter
+
+
+class LowercaseConverter(BaseConverter):
+    """
+    A URL converter that lowercases the matched path segment.
+
+    Used for case-insensitive route variables (e.g. plugin types and names), so the value is
+    normalized once during routing instead of in every view function.
+    """
+
+    def to_python(self, value: str) -> str:
+        """
+        Converts the matched path segment to lowercase.
+
+        Args:
+            value (str): The matched path segment.
+
+        Returns:
+            str: The lowercase path segment.
+        """
+        return value.lower()
@@ -1,70 +1,205 @@
+import functools
+import glob
+import hashlib
 import importlib
-import json
+import logging
 import os
-from collections import defaultdict
-from typing import Optional, Any
+import tempfile
+from typing import Dict, Iterable, Optional, Any
 
 import inflection
+import orjson
 
 from models import setup_model
 from models.setup_model import SetupModel
 from plugins.plugin_base import PluginBase
+from utilities.common import iter_files, scan_manifests
+
+# Logger for plugin discovery and loading errors
+logger = logging.getLogger(__name__)
+
+# Memoized class name to snake_case file name translation
+_underscore = functools.lru_cache(maxsize=1024)(inflection.underscore)
 
 
 class PluginFactory:
+    # Index of plugin module paths by file name, per base package, built on first module lookup
+    _MODULE_INDEX: Dict[str, Dict[str, str]] = {}
+
     @staticmethod
-    def initialize_manifest_cache(manifests_folder="manifests"):
+    def initialize_manifest_cache(manifests_folder="manifests", cache_folder=None,
+                                  manifests: Optional[Iterable[dict]] = None):
         """
-        Build a cache of plugin classes and their associated manifests.
+        Build a cache of plugin manifests and the modules implementing them.
+
+        The cache is persisted to disk, keyed by a digest of the paths and modification times of the
+        manifest and plugin files, so subsequent process starts with unchanged files only read a single
+        cache file instead of scanning and parsing every manifest. The cache file is kept in a folder owned
+        by the application (not the shared system temp folder), and its entries are validated when loaded,
+        since their module paths are imported.
+
+        Plugin modules are not imported here; each plugin class is imported on first use
+        through `load_plugin_class`, so startup does not pay for the plugins' import graphs.
 
         Args:
             manifests_folder (str): The folder where manifest JSON files are located. Defaults to "manifests".
+            cache_folder (str): The folder where the cache file is stored. Defaults to the G4_CACHE_DIR environment
+                variable, or a '.manifest-cache' folder next to the manifests folder.
+            manifests (Optional[Iterable[dict]]): Manifests already parsed from the manifests folder (for example
+                by `scan_manifests`). When provided, they are used instead of scanning the folder again.
+
+        Returns:
+            dict: A flat dictionary where the key is a (plugin type, plugin class name) tuple and the value
+            contains the associated manifest data, module path and class name. Both parts of the key are always
+            stored in lowercase.
+        """
+        # Resolve the cache file path for the current state of the manifest and plugin files
+        cache_folder = cache_folder or os.environ.get('G4_CACHE_DIR') or os.path.join(
+            os.path.dirname(os.path.abspath(manifests_folder)), ".manifest-cache")
+        digest = PluginFactory.__compute_files_digest(manifests_folder, "plugins")
+        cache_path = os.path.join(cache_folder, f"g4-manifests-v3-{digest}.json")
+
+        # Load the cache from disk if it was already built for the same files and all of its entries are valid.
+        # JSON has no tuple keys, so the cache is stored as a list of [plugin type, class name, entry] items.
+        try:
+            with open(cache_path, 'rb') as f:
+                items = orjson.loads(f.read())
+            cache = {(plugin_type, class_name): entry for plugin_type, class_name, entry in items}
+            if all(PluginFactory.__is_valid_cache_entry(key, entry) for key, entry in cache.items()):
+                return cache
+            logger.warning(f"Ignoring manifest cache {cache_path}: it contains invalid entries")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring manifest cache {cache_path}: {e}")
+
+        # Build the cache from the given manifests, scanning the manifests folder only if none were given
+        if manifests is None:
+            manifests = scan_manifests(manifests_folder)
+        cache = PluginFactory.__build_manifest_cache(manifests)
+
+        # Write the cache atomically, so concurrently starting workers never read a partial file
+        temp_path = None
+        try:
+            os.makedirs(cache_folder, mode=0o700, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_folder, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps([[*key, entry] for key, entry in cache.items()]))
+            os.replace(temp_path, cache_path)
+
+            # Remove the cache files of previous manifest and plugin file states
+            for stale_path in glob.glob(os.path.join(cache_folder, "g4-manifests-*.json")):
+                if stale_path != cache_path:
+                    os.remove(stale_path)
+        except OSError as e:
+            logger.error(f"Error writing manifest cache {cache_path}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        # Return the fully built cache
+        return cache
+
+    @staticmethod
+    def __build_manifest_cache(manifests):
+        """
+        Builds the manifest cache from parsed manifests.
+
+        Args:
+            manifests (Iterable[dict]): The parsed plugin manifests.
 
         Returns:
-            dict: A dictionary where the key is the plugin type and the value is another dictionary
-            containing the plugin class name and its associated manifest data.
+            dict: The manifest cache, as described in `initialize_manifest_cache`.
         """
-        # Initialize the cache as a defaultdict of dictionaries
-        cache = defaultdict(dict)
+        # Initialize the cache as a flat dictionary keyed by (plugin type, plugin class name)
+        cache = {}
+
+        # Loop over each parsed manifest
+        for manifest in manifests:
+            # Extract the plugin class name (key) and plugin type (type) from the manifest
+            plugin_class_name = manifest.get("key")
+            plugin_type = manifest.get("pluginType")
+
+            # Skip the manifest if either 'key' or 'type' is missing
+            if not plugin_class_name or not plugin_type:
+                continue
+
+            # Locate the module implementing the plugin class without importing it
+            try:
+                module_name = PluginFactory.__find_module_for_class(plugin_class_name)
+            except ModuleNotFoundError as e:
+                # Skip if the plugin module could not be found
+                logger.error(f"Error: {e}")
+                continue
+
+            # Store the module path, class name and manifest data in the cache under the plugin type and class name.
+            # Keys are lowercased here once, so lookups never need to normalize cached keys.
+            cache[(plugin_type.lower(), plugin_class_name.lower())] = {
+                "module": module_name,
+                "key": plugin_class_name,
+                "manifest": manifest
+            }
 
-        # Walk through the manifests folder and subfolders
-        for root, dirs, files in os.walk(manifests_folder):
-            # Loop over each file in the current directory
-            for file in files:
-                # Skip files that are not JSON files
-                if not file.endswith('.json'):
-                    continue
+        # Return the fully built cache
+        return cache
 
-                # Construct the full path to the JSON file
-                file_path = os.path.join(root, file)
+    @staticmethod
+    def __is_valid_cache_entry(key, entry) -> bool:
+        """
+        Checks that an entry loaded from the manifest cache file has the shape built by `__build_manifest_cache`.
 
-                # Load and parse the JSON manifest file
-                with open(file_path, 'r') as f:
-                    manifest = json.load(f)
+        The module path of the entry is imported on first use, so it must point into the plugins package.
 
-                    # Extract the plugin class name (key) and plugin type (type) from the manifest
-                    plugin_class_name = manifest.get("key")
-                    plugin_type = manifest.get("pluginType")
+        Args:
+            key (tuple): The (plugin type, plugin class name) key of the entry.
+            entry (dict): The cache entry.
 
-                    # Skip the manifest if either 'key' or 'type' is missing
-                    if not plugin_class_name or not plugin_type:
-                        continue
+        Returns:
+            bool: True if the entry is valid, otherwise False.
+        """
+        # Ensure the entry holds a module path, class name and manifest
+        if not isinstance(entry, dict):
+            return False
+        module_name, class_name, manifest = entry.get("module"), entry.get("key"), entry.get("manifest")
+        if not isinstance(module_name, str) or not isinstance(class_name, str) or not isinstance(manifest, dict):
+            return False
+
+        # Ensure the module is a plugin module, and the class name matches both the key and the manifest
+        return (module_name.startswith("plugins.")
+                and class_name.lower() == key[1]
+                and manifest.get("key") == class_name
+                and f"{manifest.get('pluginType')}".lower() == key[0])
 
-                    # Retrieve the actual plugin class from the PluginFactory
-                    plugin_class = PluginFactory.__find_plugin_class(plugin_class_name)
+    @staticmethod
+    def load_plugin_class(cache_model: dict) -> Any:
+        """
+        Imports, validates and returns the plugin class of a manifest cache entry.
 
-                    # Skip if the plugin class could not be found
-                    if not plugin_class:
-                        continue
+        The class is imported and checked to inherit from PluginBase on first use only. The result is
+        stored back in the cache entry under the 'class' key, so subsequent calls for the same entry are
+        a single dictionary lookup and never repeat the inheritance check.
 
-                    # Store the plugin class and manifest data in the cache under the plugin type
-                    cache[f'{plugin_type}'.lower()][f'{plugin_class_name}'.lower()] = {
-                        "class": plugin_class,
-                        "manifest": manifest
-                    }
+        Args:
+            cache_model (dict): A cache entry created by `initialize_manifest_cache`.
 
-        # Return the fully built cache
-        return cache
+        Returns:
+            Optional[PluginBase]: The plugin class if found and valid, otherwise None.
+        """
+        # Return the class if it was already resolved for this entry
+        if "class" in cache_model:
+            return cache_model["class"]
+
+        try:
+            # Import the plugin class from the module recorded when the cache was built
+            plugin_class = PluginFactory.__import_plugin_class(cache_model["module"], cache_model["key"])
+        except (ModuleNotFoundError, AttributeError, TypeError) as e:
+            # Skip plugins that can not be imported or do not inherit from PluginBase
+            logger.error(f"Error: {e}")
+            plugin_class = None
+
+        # Store the result in the entry for subsequent invocations
+        cache_model["class"] = plugin_class
+
+        return plugin_class
 
     @staticmethod
     def new_plugin(class_name: str, plugin_setup_model: SetupModel) -> Optional[PluginBase]:
@@ -79,11 +214,40 @@ class PluginFactory:
         Returns:
             Optional[PluginBase]: An instance of the plugin class if found and valid, otherwise None.
         """
-        # Find the plugin class using the class name
-        plugin_class = PluginFactory.__find_plugin_class(class_name)
+        try:
+            # Find the plugin class using the class name
+            plugin_class = PluginFactory.__find_plugin_class(class_name)
+        except (ModuleNotFoundError, AttributeError) as e:
+            # Skip plugins that can not be found or imported
+            logger.error(f"Error: {e}")
+            return None
 
-        # Instantiate the plugin class with the setup model if found
-        return plugin_class(plugin_setup_model) if plugin_class else None
+        # Instantiate the plugin class with the setup model
+        return plugin_class(plugin_setup_model)
+
+    @staticmethod
+    def __compute_files_digest(*folders) -> str:
+        """
+        Computes a digest of the paths, sizes and modification times of the manifest (.json) and
+        plugin (.py) files under the given folders.
+
+        Args:
+            *folders (str): The folders to include in the digest.
+
+        Returns:
+            str: A hexadecimal SHA-1 digest that changes whenever a file is added, removed or modified.
+        """
+        # Collect a signature for every file under the given folders
+        signatures = []
+        for folder in folders:
+            # Skip files that can not affect the cache (e.g. compiled bytecode)
+            for entry in iter_files(folder, ('.json', '.py')):
+                file_path = os.path.abspath(entry.path)
+                file_stat = entry.stat()
+                signatures.append(f"{file_path}|{file_stat.st_size}|{file_stat.st_mtime_ns}")
+
+        # Hash the sorted signatures, so the digest does not depend on the directory listing order
+        return hashlib.sha1("\n".join(sorted(signatures)).encode()).hexdigest()
 
     @staticmethod
     def __find_module_for_class(class_name, base_package="plugins"):
@@ -101,48 +265,86 @@ class PluginFactory:
             ModuleNotFoundError: If the module corresponding to the class is not found.
         """
         # Convert class name to snake_case
-        file_name = inflection.underscore(class_name) + ".py"
+        file_name = _underscore(class_name) + ".py"
+
+        # Build the module index of the base package once, instead of walking it on every lookup
+        module_index = PluginFactory._MODULE_INDEX.get(base_package)
+        if module_index is None:
+            module_index = {}
+
+            # Index the Python files of the base package, keeping the first module found for each file name
+            for entry in iter_files(base_package, '.py'):
+                if entry.name not in module_index:
+                    # Get the full module path by replacing slashes with dots and removing .py
+                    module_index[entry.name] = entry.path[:-3].replace(os.sep, '.')
+
+            PluginFactory._MODULE_INDEX[base_package] = module_index
 
-        # Start walking from the base package directory
-        for root, dirs, files in os.walk(base_package):
-            if file_name in files:
-                # Get the full module path by replacing slashes with dots and removing .py
-                module_path = os.path.join(root, file_name).replace(os.sep, '.').replace('.py', '')
-                return module_path
+        # Return the module path from the index
+        module_path = module_index.get(file_name)
+        if module_path:
+            return module_path
 
         # Raise an exception if the class is not found in the base package directory or its subdirectories
         raise ModuleNotFoundError(f"Module for class {class_name} not found in {base_package} directory")
 
     @staticmethod
+    @functools.cache
     def __find_plugin_class(class_name: str) -> Any:
         """
         Finds and validates a plugin class by dynamically importing its module and retrieving the class.
 
+        Found classes are memoized per class name, so the module lookup runs once per class, and the import
+        and validation are shared with `load_plugin_class` through `__import_plugin_class`. Failures raise
+        and are not memoized.
+
         Args:
             class_name (str): The name of the plugin class to find.
 
         Returns:
-            Optional[PluginBase]: The plugin class if found and valid, otherwise None.
+            PluginBase: The plugin class.
 
         Raises:
+            ModuleNotFoundError: If no module for the class is found, or it cannot be imported.
+            AttributeError: If the module does not define the class.
             TypeError: If the found class does not inherit from PluginBase.
         """
-        try:
-            # Find the module for the class
-            module_name = PluginFactory.__find_module_for_class(class_name)
+        # Find the module for the class
+        module_name = PluginFactory.__find_module_for_class(class_name)
 
-            # Dynamically import the module (full module path)
-            module = importlib.import_module(module_name)
+        # Import the module and retrieve the class
+        return PluginFactory.__import_plugin_class(module_name, class_name)
 
-            # Retrieve the class from the module
-            cls = getattr(module, class_name)
+    @staticmethod
+    @functools.cache
+    def __import_plugin_class(module_name: str, class_name: str) -> Any:
+        """
+        Dynamically imports a module and retrieves a plugin class from it.
 
-            # Check inheritance
-            if not issubclass(cls, PluginBase):
-                raise TypeError(f"{class_name} does not inherit from {PluginBase.__name__}")
+        Results are memoized per module and class name, so the import, attribute lookup and inheritance
+        check run once per class process-wide, whichever entry point resolves it first. Failures raise
+        and are not memoized.
 
-            # Instantiate the class with arguments
-            return cls
-        except (ModuleNotFoundError, AttributeError) as e:
-            print(f"Error: {e}")
-            return None
+        Args:
+            module_name (str): The full, dot-separated module path.
+            class_name (str): The name of the plugin class to retrieve.
+
+        Returns:
+            PluginBase: The plugin class.
+
+        Raises:
+            ModuleNotFoundError: If the module cannot be imported.
+            AttributeError: If the module does not define the class.
+            TypeError: If the found class does not inherit from PluginBase.
+        """
+        # Dynamically import the module (full module path)
+        module = importlib.import_module(module_name)
+
+        # Retrieve the class from the module
+        cls = getattr(module, class_name)
+
+        # Check inheritance
+        if not issubclass(cls, PluginBase):
+            raise TypeError(f"{class_name} does not inherit from {PluginBase.__name__}")
+
+        return cls
@@ -0,0 +1,272 @@
+import glob
+import gzip
+import hashlib
+import logging
+import mmap
+import os
+import stat
+import tempfile
+from typing import Optional, Tuple, Union
+
+import orjson
+
+# Logger for shared manifests storage errors
+logger = logging.getLogger(__name__)
+
+# Identifies this deployment by the location of its sources, so deployments sharing /dev/shm never touch
+# each other's manifests files
+_DEPLOYMENT_ID = hashlib.sha1(os.path.dirname(os.path.abspath(__file__)).encode()).hexdigest()[:12]
+
+# Prefix of the manifests files, used to find the files of previous manifest versions
+_FILE_PREFIX = "g4-manifests-"
+
+
+class SharedManifests:
+    """
+    A read-only store of pre-serialized plugin manifests, backed by memory-mapped files.
+
+    All manifests are serialized once into a single JSON array (and a gzip compressed copy of it), written
+    to a deployment-private folder in shared memory (/dev/shm when available, otherwise the system temp
+    folder) and memory-mapped read-only. The file names are derived from the content hash, so every worker
+    process serving the same manifests maps the same files and shares one copy of their pages, instead of
+    holding the serialized manifests in its own heap.
+
+    The full array is meant to be served from its file (see `path` and `gzip_path`), so the WSGI server
+    can send it with sendfile without copying it through the worker. Each manifest is serialized
+    separately inside the array, so a single manifest is returned as a slice of the mapped bytes
+    without being re-serialized.
+    """
+
+    def __init__(self, plugins_cache: dict, folder: Optional[str] = None):
+        """
+        Serializes the manifests of the plugins cache and maps them from shared memory.
+
+        Args:
+            plugins_cache (dict): The plugins cache created by `PluginFactory.initialize_manifest_cache`.
+            folder (str): The folder where the manifests files are stored. Defaults to a folder private to
+                          this deployment under /dev/shm when available, otherwise the system temp folder.
+        """
+        # Serialize each manifest and record its (start, end) offsets inside the JSON array
+        parts = []
+        offset = 1
+        self._offsets = {}
+        self._name_offsets = {}
+        for (plugin_type, class_name), cache_model in plugins_cache.items():
+            part = orjson.dumps(cache_model['manifest'])
+            parts.append(part)
+
+            # The first plugin type holding a given name wins for name lookups
+            self._offsets[(plugin_type, class_name)] = (offset, offset + len(part))
+            self._name_offsets.setdefault(class_name, (offset, offset + len(part)))
+
+            # Account for the separating comma
+            offset += len(part) + 1
+
+        data = b'[' + b','.join(parts) + b']'
+
+        # Compress the array once (without a timestamp, so the compressed bytes are the same in every worker)
+        gzip_data = gzip.compress(data, 6, mtime=0)
+
+        # Map the manifests from shared memory, falling back to the serialized bytes if it is not available
+        try:
+            folder = folder or SharedManifests.__resolve_default_folder()
+        except OSError as e:
+            logger.error(f"Error resolving the shared manifests folder: {e}")
+            folder = None
+        self._path, self._data = SharedManifests.__share(data, folder, ".json")
+        self._gzip_path, self._gzip_data = SharedManifests.__share(gzip_data, folder, ".json.gz")
+
+        # Remove the files of previous manifest versions (existing mappings stay valid)
+        if folder and self._path and self._gzip_path:
+            SharedManifests.__remove_stale_files(folder, {self._path, self._gzip_path})
+
+    @property
+    def path(self) -> Optional[str]:
+        """
+        Gets the path of the file holding the JSON array of all manifests.
+
+        Returns:
+            Optional[str]: The file path, or None if the manifests are held in memory only.
+        """
+        return self._path
+
+    @property
+    def gzip_path(self) -> Optional[str]:
+        """
+        Gets the path of the file holding the gzip compressed JSON array of all manifests.
+
+        Returns:
+            Optional[str]: The file path, or None if the manifests are held in memory only.
+        """
+        return self._gzip_path
+
+    def all(self) -> bytes:
+        """
+        Gets all manifests as a serialized JSON array.
+
+        Prefer serving the file at `path` when available; reading the mapped array copies it.
+
+        Returns:
+            bytes: The JSON array of all manifests.
+        """
+        return self._data[:]
+
+    def all_gzip(self) -> bytes:
+        """
+        Gets all manifests as a gzip compressed, serialized JSON array.
+
+        Prefer serving the file at `gzip_path` when available; reading the mapped array copies it.
+
+        Returns:
+            bytes: The gzip compressed JSON array of all manifests.
+        """
+        return self._gzip_data[:]
+
+    def get(self, plugin_type: str, plugin_name: str) -> Optional[bytes]:
+        """
+        Gets a serialized manifest by its lowercase plugin type and name.
+
+        Args:
+            plugin_type (str): The lowercase plugin type.
+            plugin_name (str): The lowercase plugin name (key/class name).
+
+        Returns:
+            Optional[bytes]: The serialized manifest, or None if not found.
+        """
+        offsets = self._offsets.get((plugin_type, plugin_name))
+        return self._data[offsets[0]:offsets[1]] if offsets else None
+
+    def get_by_name(self, plugin_name: str) -> Optional[bytes]:
+        """
+        Gets a serialized manifest by its lowercase plugin name, regardless of the plugin type.
+
+        Args:
+            plugin_name (str): The lowercase plugin name (key/class name).
+
+        Returns:
+            Optional[bytes]: The serialized manifest, or None if not found.
+        """
+        offsets = self._name_offsets.get(plugin_name)
+        return self._data[offsets[0]:offsets[1]] if offsets else None
+
+    @staticmethod
+    def __resolve_default_folder() -> str:
+        """
+        Creates (if needed) and returns the folder private to this deployment and user in shared memory.
+
+        Returns:
+            str: The folder path.
+
+        Raises:
+            OSError: If the folder can not be created, or exists but is not a directory owned by the current
+                     user and writable by it only.
+        """
+        # Resolve the folder under the shared memory folder, or the system temp folder if not available
+        base_folder = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+        folder = os.path.join(base_folder, f"g4-external-python-{_DEPLOYMENT_ID}")
+        os.makedirs(folder, mode=0o700, exist_ok=True)
+
+        # Refuse folders other users could write to (e.g. created in advance by another user)
+        folder_stat = os.lstat(folder)
+        if not stat.S_ISDIR(folder_stat.st_mode):
+            raise OSError(f"{folder} is not a directory")
+        if hasattr(os, 'getuid') and (folder_stat.st_uid != os.getuid() or folder_stat.st_mode & 0o022):
+            raise OSError(f"{folder} must be owned by the current user and not writable by others")
+
+        return folder
+
+    @staticmethod
+    def __share(data: bytes, folder: Optional[str], suffix: str) -> Tuple[Optional[str], Union[mmap.mmap, bytes]]:
+        """
+        Writes the data to a content-addressed file (unless a valid one already exists) and maps it read-only.
+
+        Args:
+            data (bytes): The data to share.
+            folder (str): The folder where the file is stored, or None to keep the data in memory only.
+            suffix (str): The file name suffix (e.g. '.json').
+
+        Returns:
+            Tuple[Optional[str], Union[mmap.mmap, bytes]]: The file path and the read-only mapping of the file,
+            or None and the data itself if the file could not be written or mapped.
+        """
+        if not folder:
+            return None, data
+
+        # Resolve the content-addressed file path
+        digest = hashlib.sha256(data).digest()
+        file_path = os.path.join(folder, f"{_FILE_PREFIX}{digest.hex()}{suffix}")
+
+        temp_path = None
+        try:
+            # Map an existing file (written by another worker) if its content matches the data
+            mapping = SharedManifests.__map_verified_file(file_path, len(data), digest)
+            if mapping is not None:
+                return file_path, mapping
+
+            # Otherwise, write the file atomically and map it
+            fd, temp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, file_path)
+            temp_path = None
+
+            mapping = SharedManifests.__map_verified_file(file_path, len(data), digest)
+            if mapping is None:
+                raise ValueError("the written file does not match the manifests")
+
+            return file_path, mapping
+
+        except (OSError, ValueError) as e:
+            logger.error(f"Error mapping shared manifests {file_path}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None, data
+
+    @staticmethod
+    def __map_verified_file(file_path: str, size: int, digest: bytes) -> Optional[mmap.mmap]:
+        """
+        Maps a file read-only if its size and SHA-256 digest match the expected ones.
+
+        The digest is computed over the mapping itself, so the verified content is the mapped content.
+
+        Args:
+            file_path (str): The path of the file.
+            size (int): The expected file size.
+            digest (bytes): The expected SHA-256 digest of the file content.
+
+        Returns:
+            Optional[mmap.mmap]: The read-only mapping of the file, or None if it does not exist or does not match.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                # Skip mapping files of a different (or zero) size
+                if size == 0 or os.fstat(f.fileno()).st_size != size:
+                    return None
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+        # Keep the mapping only if its content matches
+        if hashlib.sha256(mapping).digest() != digest:
+            mapping.close()
+            return None
+
+        return mapping
+
+    @staticmethod
+    def __remove_stale_files(folder: str, current_paths: set):
+        """
+        Removes manifests files of previous manifest versions from the folder.
+
+        Args:
+            folder (str): The folder holding the manifests files.
+            current_paths (set): The paths of the current manifests files, which are kept.
+        """
+        for file_path in glob.glob(os.path.join(folder, f"{_FILE_PREFIX}*")):
+            if file_path in current_paths:
+                continue
+            try:
+                os.remove(file_path)
+            except OSError:
+                # The file may be in use (e.g. mapped on Windows) or already removed by another worker
+                pass